@@ -1,8 +1,8 @@
 import os
 import sys
 import importlib.util
-from typing import List, Dict, Any, Optional, Tuple
-from collections import Counter
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
+import bisect
 import random
 from enum import Enum
 
@@ -60,31 +60,89 @@ HAND_RANK_LABELS = {
     0: "No Hand",
 }
 
+RANKS = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
+RANK_VALUES = {rank: value for value, rank in enumerate(RANKS, start=2)}
+SUIT_INDEX = {suit: index for index, suit in enumerate(Suit)}
+
+# Fallback action mix for seats without an agent, stored as cumulative weights
+# so a single random draw can be bisected straight into an action.
+RANDOM_ACTIONS = ("fold", "call", "check", "raise")
+RANDOM_ACTION_CUM_WEIGHTS = (0.1, 0.4, 0.7, 1.0)  # Favor call/check/raise over fold
+
+# Actions an agent may send once its decision has been normalized
+AGENT_ACTIONS = frozenset({"fold", "check", "call", "raise", "all-in"})
+
 class Card:
     def __init__(self, rank: str, suit: Suit):
         self.rank = rank
         self.suit = suit
+        # Resolved once per card; the evaluator reads these on every hand
+        self.value = RANK_VALUES[rank]
+        self.suit_index = SUIT_INDEX[suit]
+        self.rank_bit = 1 << (self.value - 2)  # Two = bit 0 ... Ace = bit 12
+        self.rank_nibble = 1 << (4 * (self.value - 2))  # One count in this rank's 4-bit field
+        self.display_text = f"{rank}\n{suit.value}"  # Face text for the GUI card widgets
+        self._name = f"{rank} of {suit.value}"
     
     def __str__(self):
-        return f"{self.rank} of {self.suit.value}"
+        return self._name
     
     def __repr__(self):
         return f"Card({self.rank}, {self.suit.value})"
     
     def get_value(self):
         """Get numeric value for comparison"""
-        if self.rank == 'A':
-            return 14
-        elif self.rank == 'K':
-            return 13
-        elif self.rank == 'Q':
-            return 12
-        elif self.rank == 'J':
-            return 11
-        else:
-            return int(self.rank)
+        return self.value
+
+# Cards are never mutated, so every hand is dealt from the same 52 instances.
+FULL_DECK = tuple(Card(rank, suit) for rank in RANKS for suit in Suit)
+
+def _build_straight_table() -> Tuple[int, ...]:
+    """Map every 13-bit rank mask (bit 0 = Two ... bit 12 = Ace) to its best straight's high card."""
+    table = []
+    for rank_mask in range(1 << 13):
+        # Shift so bit b stands for value b, and let the Ace also play low for the wheel
+        value_mask = rank_mask << 2
+        if value_mask & (1 << 14):
+            value_mask |= 1 << 1
+        # Bit b survives only when bits b..b+4 are all set, i.e. a run starting at b
+        runs = value_mask & (value_mask >> 1) & (value_mask >> 2) & (value_mask >> 3) & (value_mask >> 4)
+        # The top surviving bit is the low card of the best run; its high card is 4 above
+        table.append(runs.bit_length() - 1 + 4 if runs else 0)
+    return tuple(table)
+
+# Straight detection becomes one index once a hand's ranks are OR-ed into a mask
+STRAIGHT_HIGH_BY_MASK = _build_straight_table()
+
+# Lowest bit of each of the 13 per-rank 4-bit counters in a packed rank histogram
+NIBBLE_LOW_BITS = int("1" * 13, 16)
+
+def _top_rank_values(rank_mask: int, limit: int) -> List[int]:
+    """Return up to limit card values from a 13-bit rank mask, highest first."""
+    values = []
+    while rank_mask and len(values) < limit:
+        top = rank_mask.bit_length() - 1
+        values.append(top + 2)
+        rank_mask ^= 1 << top
+    return values
+
+def _nibble_rank_values(flags: int) -> List[int]:
+    """Return the card values flagged in a packed histogram's low nibble bits, highest first."""
+    values = []
+    while flags:
+        top = flags.bit_length() - 1
+        values.append((top >> 2) + 2)
+        flags ^= 1 << top
+    return values
 
 class Player:
+    # Seats are read on every engine step and GUI refresh; keep their layout fixed
+    __slots__ = (
+        "name", "chips", "hole_cards", "current_bet", "total_bet", "is_folded",
+        "is_all_in", "agent", "position", "last_action", "last_action_display",
+        "best_hand_rank", "best_hand_name", "pending_invalid_reason", "is_eliminated",
+    )
+
     def __init__(self, name: str, chips: int = 100, agent=None):
         self.name = name
         self.chips = chips
@@ -135,8 +193,31 @@ class Player:
         self.pending_invalid_reason = None
         # do not reset is_eliminated here; elimination persists across hands
 
+class PlayerSnap(NamedTuple):
+    """Read-only copy of the seat fields the displays render"""
+    name: str
+    chips: int
+    current_bet: int
+    total_bet: int
+    is_folded: bool
+    is_all_in: bool
+    is_eliminated: bool
+    last_action: Optional[str]
+    last_action_display: Optional[str]
+    best_hand_name: Optional[str]
+    hole_cards: Tuple[Card, ...]
+
+class GameSnapshot(NamedTuple):
+    """Read-only copy of the table state, taken once per GUI refresh"""
+    pot: int
+    hand_count: int
+    game_phase: str
+    current_player: int
+    community_cards: Tuple[Card, ...]
+    players: Tuple[PlayerSnap, ...]
+
 class GameState:
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.players = []
         self.community_cards = []
         self.pot = 0
@@ -148,16 +229,39 @@ class GameState:
         self.winner = None
         self.pending_players = set()
         self.hand_count = 0
+        # Dedicated generator for dealing and fallback actions; seed it to replay a session
+        self.rng = random.Random(seed)
         
     def reset_deck(self):
-        ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
-        suits = [Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS, Suit.SPADES]
-        self.deck = [Card(rank, suit) for rank in ranks for suit in suits]
-        random.shuffle(self.deck)
+        # No up-front shuffle: deal_card draws uniformly from what is left, so
+        # only the handful of cards actually dealt in a hand are ever shuffled.
+        self.deck = list(FULL_DECK)
+    
+    def snapshot(self) -> GameSnapshot:
+        """Copy the displayed state so a refresh reads plain tuples, not live objects"""
+        return GameSnapshot(
+            self.pot,
+            self.hand_count,
+            self.game_phase,
+            self.current_player,
+            tuple(self.community_cards),
+            tuple(
+                PlayerSnap(
+                    p.name, p.chips, p.current_bet, p.total_bet, p.is_folded,
+                    p.is_all_in, p.is_eliminated, p.last_action,
+                    p.last_action_display, p.best_hand_name, tuple(p.hole_cards),
+                )
+                for p in self.players
+            ),
+        )
     
     def deal_card(self) -> Card:
-        if self.deck:
-            return self.deck.pop()
+        deck = self.deck
+        if deck:
+            # One partial Fisher-Yates step: swap a random remaining card to the end.
+            j = self.rng.randrange(len(deck))
+            deck[j], deck[-1] = deck[-1], deck[j]
+            return deck.pop()
         return None
 
 class GameManager:
@@ -166,10 +270,11 @@ class GameManager:
         move_interval: float = 1.0,
         starting_chips: int = PokerAgentBase.STARTING_CHIPS,
         max_hand_limit: Optional[int] = None,
+        seed: Optional[int] = None,
     ):
         """Initialize the game engine and eagerly load any available agents."""
         PokerAgentBase.STARTING_CHIPS = starting_chips
-        self.game_state = GameState()
+        self.game_state = GameState(seed)
         self.gui = None
         self.move_interval = move_interval
         self.last_action_note = None
@@ -177,6 +282,8 @@ class GameManager:
         self.game_over = False
         self.starting_chips = starting_chips
         self.max_hand_limit = max_hand_limit
+        # Showdown evaluations for the current hand, keyed by the exact cards held
+        self._hand_eval_cache = {}
         self.load_agents()
     
     def load_agents(self):
@@ -249,6 +356,7 @@ class GameManager:
         self.game_state.current_bet = 0
         self.game_state.winner = None
         self.pending_new_hand = False
+        self._hand_eval_cache.clear()
         
         # Reset only active players (those with chips)
         for player in self.game_state.players:
@@ -431,89 +539,81 @@ class GameManager:
     def evaluate_hand(self, cards: List[Card]) -> Tuple[int, List[int]]:
         """Evaluate a poker hand and return (hand_rank, kickers)"""
         if len(cards) < 5:
-            values = sorted([card.get_value() for card in cards], reverse=True)
+            values = sorted([card.value for card in cards], reverse=True)
             return (1 if values else 0, values)
         
-        # Get all possible 5-card combinations
-        from itertools import combinations
-        best_hand = (0, [])
-        
-        for combo in combinations(cards, 5):
-            hand_rank, kickers = self._evaluate_five_cards(list(combo))
-            if hand_rank > best_hand[0] or (hand_rank == best_hand[0] and kickers > best_hand[1]):
-                best_hand = (hand_rank, kickers)
-        
-        return best_hand
+        return self._evaluate_best_hand(cards)
     
-    def _evaluate_five_cards(self, cards: List[Card]) -> Tuple[int, List[int]]:
-        """Evaluate a 5-card hand"""
-        values = [card.get_value() for card in cards]
-        suits = [card.suit for card in cards]
-        value_counts = Counter(values)
-        sorted_values_desc = sorted(values, reverse=True)
-        
-        is_flush = len(set(suits)) == 1
-        is_straight, straight_high = self._is_straight(values)
+    def _evaluate_best_hand(self, cards: List[Card]) -> Tuple[int, List[int]]:
+        """Evaluate the best 5-card hand within 5-7 cards in a single pass"""
+        # rank_counts packs a 4-bit counter per rank (SWAR), alongside a rank bitset
+        # and card count per suit, so every category reduces to a few mask operations
+        rank_counts = 0
+        rank_mask = 0
+        suit_masks = [0, 0, 0, 0]
+        suit_counts = [0, 0, 0, 0]
+        for card in cards:
+            rank_bit = card.rank_bit
+            suit_index = card.suit_index
+            rank_counts += card.rank_nibble
+            rank_mask |= rank_bit
+            suit_masks[suit_index] |= rank_bit
+            suit_counts[suit_index] += 1
+        # With at most seven cards only one suit can hold a flush
+        most_suited = max(suit_counts)
+        flush_mask = suit_masks[suit_counts.index(most_suited)] if most_suited >= 5 else 0
         
-        count_groups = sorted(
-            value_counts.items(),
-            key=lambda item: (-item[1], -item[0])
-        )
-        # Frequency distribution simplifies identifying pairs, trips, etc.
-        counts = [count for _, count in count_groups]
-        ordered_vals = [val for val, _ in count_groups]
-        secondary_count = counts[1] if len(counts) > 1 else 0
-        
-        if is_flush and is_straight:
-            if straight_high == 14 and sorted(values) == [10, 11, 12, 13, 14]:
+        if flush_mask:
+            straight_flush_high = STRAIGHT_HIGH_BY_MASK[flush_mask]
+            if straight_flush_high == 14:
                 return (10, [14])
-            return (9, [straight_high])
+            if straight_flush_high:
+                return (9, [straight_flush_high])
         
-        if counts[0] == 4:
-            four = ordered_vals[0]
-            kicker = max(v for v in values if v != four)
-            return (8, [four, kicker])
+        # Counter value 4 sets bit 2; 3 sets bits 0 and 1; 2 sets bit 1 alone
+        quads = (rank_counts >> 2) & NIBBLE_LOW_BITS
+        if quads:
+            four = ((quads.bit_length() - 1) >> 2) + 2
+            kickers = _top_rank_values(rank_mask & ~(1 << (four - 2)), 1)
+            return (8, [four] + kickers)
         
-        if counts[0] == 3 and secondary_count == 2:
-            return (7, [ordered_vals[0], ordered_vals[1]])
+        trips = rank_counts & (rank_counts >> 1) & NIBBLE_LOW_BITS
+        pairs = (rank_counts >> 1) & ~rank_counts & NIBBLE_LOW_BITS
+        trip_values = _nibble_rank_values(trips)
         
-        if is_flush:
-            return (6, sorted_values_desc)
+        # A second set of trips counts as the pair of a full house
+        if len(trip_values) > 1:
+            return (7, trip_values[:2])
+        if trip_values and pairs:
+            return (7, [trip_values[0], _nibble_rank_values(pairs)[0]])
         
-        if is_straight:
+        if flush_mask:
+            return (6, _top_rank_values(flush_mask, 5))
+        
+        straight_high = STRAIGHT_HIGH_BY_MASK[rank_mask]
+        if straight_high:
             return (5, [straight_high])
         
-        if counts[0] == 3:
-            kickers = sorted([v for v in values if v != ordered_vals[0]], reverse=True)
-            return (4, [ordered_vals[0]] + kickers)
+        if trip_values:
+            trips_value = trip_values[0]
+            kickers = _top_rank_values(rank_mask & ~(1 << (trips_value - 2)), 2)
+            return (4, [trips_value] + kickers)
         
-        if counts[0] == 2 and secondary_count == 2:
-            high_pair, low_pair = ordered_vals[:2]
-            kicker = max(v for v in values if v not in (high_pair, low_pair))
-            return (3, [high_pair, low_pair, kicker])
+        pair_values = _nibble_rank_values(pairs)
+        if len(pair_values) >= 2:
+            high_pair, low_pair = pair_values[:2]
+            # A third pair may still play as the kicker
+            kickers = _top_rank_values(
+                rank_mask & ~(1 << (high_pair - 2)) & ~(1 << (low_pair - 2)), 1
+            )
+            return (3, [high_pair, low_pair] + kickers)
         
-        if counts[0] == 2:
-            pair = ordered_vals[0]
-            kickers = sorted([v for v in values if v != pair], reverse=True)
+        if pair_values:
+            pair = pair_values[0]
+            kickers = _top_rank_values(rank_mask & ~(1 << (pair - 2)), 3)
             return (2, [pair] + kickers)
         
-        return (1, sorted_values_desc)
-    
-    def _is_straight(self, values: List[int]) -> Tuple[bool, int]:
-        """Check if values form a straight and return (is_straight, high_card)"""
-        unique_values = sorted(set(values))
-        if len(unique_values) != 5:
-            return False, 0
-        
-        # Wheel straight (A-2-3-4-5)
-        if unique_values == [2, 3, 4, 5, 14]:
-            return True, 5
-        
-        for i in range(4):
-            if unique_values[i + 1] - unique_values[i] != 1:
-                return False, 0
-        
-        return True, unique_values[-1]
+        return (1, _top_rank_values(rank_mask, 5))
     
     def determine_winner(self) -> List[Player]:
         """Determine the winner(s) of the current hand"""
@@ -532,21 +632,33 @@ class GameManager:
         # Evaluate each player's best hand
         player_hands = []
         for player in active_players:
-            all_cards = player.hole_cards + self.game_state.community_cards
-            hand_rank, kickers = self.evaluate_hand(all_cards)
+            # The river deal and the showdown step both ask for the same result
+            all_cards = tuple(player.hole_cards + self.game_state.community_cards)
+            evaluation = self._hand_eval_cache.get(all_cards)
+            if evaluation is None:
+                evaluation = self.evaluate_hand(list(all_cards))
+                self._hand_eval_cache[all_cards] = evaluation
+            hand_rank, kickers = evaluation
             player.best_hand_rank = hand_rank
             player.best_hand_name = self._hand_rank_to_name(hand_rank, kickers)
-            player_hands.append((player, hand_rank, kickers))
-        
-        # Sort by hand strength
-        player_hands.sort(key=lambda x: (x[1], x[2]), reverse=True)
+            player_hands.append((player, self._hand_strength(hand_rank, kickers)))
         
-        # Find winners (players with the same best hand)
-        best_hand = player_hands[0][1:]
-        winners = [p[0] for p in player_hands if p[1:] == best_hand]
+        # Find winners (players with the same best hand), keeping seat order
+        best_strength = max(strength for _, strength in player_hands)
+        winners = [p for p, strength in player_hands if strength == best_strength]
         
         return winners
     
+    def _hand_strength(self, hand_rank: int, kickers: List[int]) -> int:
+        """Pack (hand_rank, kickers) into one int that orders hands like the tuple would"""
+        # Rank in bits 20-23, then up to five 4-bit kickers from most to least significant
+        strength = hand_rank << 20
+        shift = 16
+        for kicker in kickers[:5]:
+            strength |= kicker << shift
+            shift -= 4
+        return strength
+    
     def award_pot(self, winners: List[Player]):
         """Award the pot to the winner(s)"""
         if not winners:
@@ -588,10 +700,8 @@ class GameManager:
     
     def get_random_action(self, player: Player) -> Tuple[str, int]:
         """Get a random action for a player"""
-        actions = ["fold", "call", "check", "raise"]
-        weights = [0.1, 0.3, 0.3, 0.3]  # Favor call/check/raise over fold
-        
-        action = random.choices(actions, weights=weights)[0]
+        rng = self.game_state.rng
+        action = RANDOM_ACTIONS[bisect.bisect(RANDOM_ACTION_CUM_WEIGHTS, rng.random())]
         amount = 0
         call_amount = max(0, self.game_state.current_bet - player.current_bet)
 
@@ -609,7 +719,7 @@ class GameManager:
                 return "check", 0
 
             min_raise = max(1, min(5, raise_cap))
-            amount = random.randint(min_raise, raise_cap) if raise_cap >= min_raise else raise_cap
+            amount = rng.randint(min_raise, raise_cap) if raise_cap >= min_raise else raise_cap
             amount = max(1, amount)
 
             if call_amount + amount > player.chips:
@@ -729,31 +839,33 @@ class GameManager:
         """Get action from player's agent"""
         agent = player.agent
         if agent and hasattr(agent, 'make_decision'):
+            # Per-decision facts are resolved once and shared by the checks below
+            is_base_agent = isinstance(agent, PokerAgentBase)
             try:
                 game_state = self._build_agent_game_state(player)
-                prepared = False
-                if isinstance(agent, PokerAgentBase):
+                call_required = game_state['call_required']
+                if is_base_agent:
                     agent._prepare_turn(game_state)
-                    prepared = True
                 decision = agent.make_decision(game_state)
                 action, amount = self._normalize_agent_action(decision)
-                if action is None or not self._is_valid_agent_action(player, action, amount):
+                if action is None or not self._is_valid_agent_action(
+                    player, action, amount, call_required
+                ):
                     player.pending_invalid_reason = (
                         f"{player.name}'s agent attempted an invalid move ({decision})."
                     )
-                    if isinstance(agent, PokerAgentBase):
+                    if is_base_agent:
                         agent.debug(
-                            f"Invalid decision {decision} with call_required={game_state['call_required']} "
+                            f"Invalid decision {decision} with call_required={call_required} "
                             f"and stack={player.chips}"
                         )
                     return "fold", 0
                 if action == "all-in":
-                    call_required = game_state['call_required']
                     available = player.chips
                     if available <= 0:
                         return "fold", 0
                     if call_required > available:
-                        if isinstance(agent, PokerAgentBase):
+                        if is_base_agent:
                             agent.debug(
                                 f"Invalid all-in: needs ${call_required} to call but only has ${available}"
                             )
@@ -764,11 +876,11 @@ class GameManager:
                     return "raise", raise_amount
                 return action, amount
             except Exception as exc:
-                if isinstance(agent, PokerAgentBase):
+                if is_base_agent:
                     agent.debug(f"Error during decision: {exc}")
                 return "fold", 0
             finally:
-                if isinstance(agent, PokerAgentBase):
+                if is_base_agent:
                     agent._finish_turn()
         
         # Fallback to random action
@@ -776,20 +888,22 @@ class GameManager:
     
     def next_player(self):
         """Move to the next active player"""
-        if not self.game_state.players:
+        players = self.game_state.players
+        if not players:
             return
 
-        total_players = len(self.game_state.players)
+        pending = self.game_state.pending_players
+        total_players = len(players)
         start_index = self.game_state.current_player
 
         for offset in range(1, total_players + 1):
             candidate = (start_index + offset) % total_players
-            candidate_player = self.game_state.players[candidate]
+            candidate_player = players[candidate]
 
             if (candidate_player.is_folded or candidate_player.is_all_in or
                     candidate_player.chips <= 0 or candidate_player.is_eliminated):
                 continue
-            if self.game_state.pending_players and candidate not in self.game_state.pending_players:
+            if pending and candidate not in pending:
                 continue
 
             self.game_state.current_player = candidate
@@ -858,17 +972,17 @@ class GameManager:
 
     def _reset_pending_players(self, starting_index=None):
         """Reset the set of players who still need to act in the current betting round"""
-        self.game_state.pending_players = set(self._players_who_can_act())
+        pending = self.game_state.pending_players = set(self._players_who_can_act())
 
-        if not self.game_state.pending_players:
+        if not pending:
             return
 
         target_index = self.game_state.current_player if starting_index is None else starting_index
-        if target_index not in self.game_state.pending_players:
+        if target_index not in pending:
             total_players = len(self.game_state.players)
             for offset in range(total_players):
                 candidate = (target_index + offset) % total_players
-                if candidate in self.game_state.pending_players:
+                if candidate in pending:
                     self.game_state.current_player = candidate
                     break
         else:
@@ -876,12 +990,14 @@ class GameManager:
 
     def _remove_inactive_from_pending(self):
         """Remove players who can no longer act from the pending set"""
+        players = self.game_state.players
+        total_players = len(players)
         inactive = {
-            idx for idx in list(self.game_state.pending_players)
-            if idx >= len(self.game_state.players)
-            or self.game_state.players[idx].is_folded
-            or self.game_state.players[idx].is_all_in
-            or self.game_state.players[idx].chips <= 0
+            idx for idx in self.game_state.pending_players
+            if idx >= total_players
+            or players[idx].is_folded
+            or players[idx].is_all_in
+            or players[idx].chips <= 0
         }
         self.game_state.pending_players -= inactive
     
@@ -1024,13 +1140,19 @@ class GameManager:
 
         return action, amount_value
 
-    def _is_valid_agent_action(self, player: Player, action: str, amount: Optional[int]) -> bool:
-        """Validate an agent-provided action."""
-        allowed_actions = {"fold", "check", "call", "raise", "all-in"}
-        if action not in allowed_actions:
+    def _is_valid_agent_action(
+        self,
+        player: Player,
+        action: str,
+        amount: Optional[int],
+        call_required: Optional[int] = None,
+    ) -> bool:
+        """Validate an agent-provided action, reusing call_required when the caller has it."""
+        if action not in AGENT_ACTIONS:
             return False
 
-        call_required = max(0, self.game_state.current_bet - player.current_bet)
+        if call_required is None:
+            call_required = max(0, self.game_state.current_bet - player.current_bet)
         available = player.chips
 
         if action == "fold":
@@ -8,6 +8,9 @@ class PokerAgentBase(ABC):
     DEFAULT_NAME = "Poker Agent"
     STARTING_CHIPS = 100
 
+    # Slot-speed access for the base fields; subclasses keep a __dict__ for their own state.
+    __slots__ = ("name", "chips", "_game_state")
+
     def __init__(self, name: Optional[str] = None):
         self.name = name or self.DEFAULT_NAME
         self.chips = self.STARTING_CHIPS
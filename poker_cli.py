@@ -28,74 +28,81 @@ class PokerCLI:
     
     def display_game_state(self):
         """Display current game state"""
-        print("\n" + "="*60)
+        # Collect the whole screen and emit it with a single write
+        lines = ["\n" + "="*60]
         limit = self.game.max_hand_limit
         hand_no = self.game.game_state.hand_count
         hand_line = f"HAND #: {hand_no}"
         if limit:
             hand_line += f" / {limit}"
-        print(hand_line)
-        print(f"POT: ${self.game.game_state.pot}")
-        print(f"PHASE: {self.game.game_state.game_phase.upper()}")
+        lines.append(hand_line)
+        lines.append(f"POT: ${self.game.game_state.pot}")
+        lines.append(f"PHASE: {self.game.game_state.game_phase.upper()}")
         if self.game.game_state.players:
             current_idx = self.game.game_state.current_player
             current_idx = min(current_idx, len(self.game.game_state.players) - 1)
-            print(f"CURRENT PLAYER: {self.game.game_state.players[current_idx].name}")
+            lines.append(f"CURRENT PLAYER: {self.game.game_state.players[current_idx].name}")
         else:
-            print("CURRENT PLAYER: None")
-        print("="*60)
+            lines.append("CURRENT PLAYER: None")
+        lines.append("="*60)
         
         # Display community cards
         if self.game.game_state.community_cards:
-            print("COMMUNITY CARDS:")
+            lines.append("COMMUNITY CARDS:")
             for i, card in enumerate(self.game.game_state.community_cards):
-                print(f"  {i+1}. {card}")
+                lines.append(f"  {i+1}. {card}")
         else:
-            print("COMMUNITY CARDS: None yet")
+            lines.append("COMMUNITY CARDS: None yet")
         
-        print("\nPLAYERS:")
+        lines.append("\nPLAYERS:")
         for i, player in enumerate(self.game.game_state.players):
             status = []
             if player.is_folded:
                 status.append("FOLDED")
             if player.is_all_in:
                 status.append("ALL IN")
-            if getattr(player, "is_eliminated", False):
+            if player.is_eliminated:
                 status.append("ELIMINATED")
             if player.current_bet > 0:
                 status.append(f"BET: ${player.current_bet}")
             
             status_str = f" ({', '.join(status)})" if status else ""
             
-            print(f"  {i+1}. {player.name}: ${player.chips} chips{status_str}")
+            lines.append(f"  {i+1}. {player.name}: ${player.chips} chips{status_str}")
             if player.hole_cards and not player.is_folded:
-                print(f"     Cards: {[str(card) for card in player.hole_cards]}")
+                lines.append(f"     Cards: {[str(card) for card in player.hole_cards]}")
             if player.best_hand_name:
-                print(f"     Best Hand: {player.best_hand_name}")
+                lines.append(f"     Best Hand: {player.best_hand_name}")
             if player.last_action_display:
-                print(f"     Last Move: {player.last_action_display}")
+                lines.append(f"     Last Move: {player.last_action_display}")
+        
+        print("\n".join(lines))
     
     def show_menu(self):
         """Show the main menu"""
-        print("\n" + "="*40)
-        print("POKER GAME MENU")
-        print("="*40)
-        print("1. New Hand")
-        print("2. Next Phase")
-        print("3. Play Autonomous Round")
-        print("4. Show Game State")
-        print("5. Quit")
-        print("="*40)
+        print("\n".join([
+            "\n" + "="*40,
+            "POKER GAME MENU",
+            "="*40,
+            "1. New Hand",
+            "2. Next Phase",
+            "3. Play Autonomous Round",
+            "4. Show Game State",
+            "5. Quit",
+            "="*40,
+        ]))
     
     def player_action_menu(self):
         """Show player action menu"""
         current_player = self.game.game_state.players[self.game.game_state.current_player]
-        print(f"\n{current_player.name}'s turn:")
-        print("1. Fold")
-        print("2. Call")
-        print("3. Check")
-        print("4. Raise")
-        print("5. Back to main menu")
+        print("\n".join([
+            f"\n{current_player.name}'s turn:",
+            "1. Fold",
+            "2. Call",
+            "3. Check",
+            "4. Raise",
+            "5. Back to main menu",
+        ]))
         
         choice = input("Choose action (1-5): ").strip()
         
@@ -1,8 +1,49 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import math
+import queue
+import threading
+import time
 from typing import List, Optional
 
+def _set_text(cache, key, var, text):
+    """Push text into a label's StringVar only when it differs from the last value set."""
+    if cache.get(key) != text:
+        var.set(text)
+        cache[key] = text
+
+# Background and text colours for each player widget state
+PLAYER_PALETTES = {
+    'normal': ('lightblue', 'black'),
+    'current': ('yellow', 'black'),
+    'eliminated': ('lightgray', 'gray'),
+}
+
+def _seat_centers(total_players):
+    """Canvas centre of each seat, spread around the table oval"""
+    radius_x = 220 + max(0, total_players - 4) * 20
+    radius_y = min(200, 150 + max(0, total_players - 4) * 12)
+    return tuple(
+        (
+            400 + radius_x * math.cos(2 * math.pi * i / total_players),
+            250 + radius_y * math.sin(2 * math.pi * i / total_players),
+        )
+        for i in range(total_players)
+    )
+
+# Seat layouts for the table sizes the game supports
+SEAT_CENTERS = {n: _seat_centers(n) for n in range(1, 10)}
+
+# Fixed part of a player's status line, indexed by a bitmask of
+# folded (1), all in (2) and out of chips (4)
+STATUS_FLAG_TEXT = tuple(
+    " | ".join(
+        text for bit, text in ((1, "FOLDED"), (2, "ALL IN"), (4, "OUT OF CHIPS"))
+        if mask & bit
+    )
+    for mask in range(8)
+)
+
 class CardWidget:
     """Widget for displaying a card as text"""
     def __init__(self, parent, card=None, width=80, height=110, font_size=16):
@@ -11,33 +52,52 @@ class CardWidget:
         self.width = width
         self.height = height
         self.font_size = font_size
-        self.frame = tk.Frame(parent, width=width, height=height, 
-                             relief=tk.RAISED, bd=2, bg='white')
-        self.frame.pack_propagate(False)
-        self.frame.grid_propagate(False)
-        self.label = tk.Label(
-            self.frame,
+        self.frame = tk.Label(
+            parent,
             text=self._get_card_text(),
+            image=self._blank_image(parent),
+            compound='center',
+            width=width - 4,
+            height=height - 4,
+            padx=0,
+            pady=0,
+            relief=tk.RAISED,
+            bd=2,
             font=('Helvetica', self.font_size, 'bold'),
             bg='white',
             fg='black',
-            justify='center'
+            justify='center',
+            wraplength=width - 12
         )
-        self.label.config(wraplength=self.width - 12)
-        self.label.pack(expand=True, fill='both', padx=6, pady=6)
+    
+    @staticmethod
+    def _blank_image(parent):
+        """Blank 1x1 image so the Label sizes in pixels rather than characters"""
+        # Images belong to one Tk interpreter, so each window keeps its own
+        toplevel = parent.winfo_toplevel()
+        image = getattr(toplevel, "_card_blank_image", None)
+        if image is None:
+            image = tk.PhotoImage(master=toplevel, width=1, height=1)
+            toplevel._card_blank_image = image
+        return image
     
     def _get_card_text(self):
         if self.card is None:
             return "??"
-        return f"{self.card.rank}\n{self.card.suit.value}"
+        return self.card.display_text
     
     def update_card(self, card):
+        if card is self.card:
+            return
         self.card = card
-        self.label.config(text=self._get_card_text())
+        self.frame.config(text=self._get_card_text())
     
     def pack(self, **kwargs):
         self.frame.pack(**kwargs)
     
+    def pack_forget(self):
+        self.frame.pack_forget()
+    
     def grid(self, **kwargs):
         self.frame.grid(**kwargs)
 
@@ -58,11 +118,12 @@ class PlayerWidget:
         self.body_font = max(8, int(9 * self.scale))
         self.small_font = max(7, int(8 * self.scale))
         
-        # Calculate position on the oval table
-        angle = (2 * math.pi * position) / total_positions
-        self.x = 200 + 150 * math.cos(angle)
-        self.y = 200 + 100 * math.sin(angle)
-        
+        # Last text pushed per label, so refreshes only send Tk what changed
+        self._applied = {}
+        self._color_state = 'normal'  # Matches the colours create_widget builds with
+        # Player fields behind the last refresh; an identical tuple means nothing to redo
+        self._cached = None
+        self._status_key = None
         self.create_widget()
     
     def create_widget(self):
@@ -70,11 +131,17 @@ class PlayerWidget:
         self.frame = tk.Frame(self.parent, bg='lightblue', relief=tk.RAISED, bd=2)
         self.frame.config(width=self.width, height=self.height)
         self.frame.pack_propagate(False)
+        
+        self.hand_var = tk.StringVar(self.frame)
+        self.chips_var = tk.StringVar(self.frame, value=f"${self.player.chips}")
+        self.last_action_var = tk.StringVar(self.frame)
+        self.bet_var = tk.StringVar(self.frame)
+        self.status_var = tk.StringVar(self.frame)
 
         # Hand label (updated at showdown)
         self.hand_label = tk.Label(
             self.frame,
-            text="",
+            textvariable=self.hand_var,
             font=('Arial', self.body_font, 'italic'),
             bg='lightblue',
             fg='black',
@@ -89,7 +156,7 @@ class PlayerWidget:
         self.name_label.pack()
         
         # Player chips
-        self.chips_label = tk.Label(self.frame, text=f"${self.player.chips}", 
+        self.chips_label = tk.Label(self.frame, textvariable=self.chips_var, 
                                    font=('Arial', self.body_font), bg='lightblue')
         self.chips_label.pack()
         
@@ -122,7 +189,7 @@ class PlayerWidget:
         # Last action label
         self.last_action_label = tk.Label(
             self.frame,
-            text="",
+            textvariable=self.last_action_var,
             font=('Arial', self.small_font, 'italic'),
             bg='lightblue'
         )
@@ -131,7 +198,7 @@ class PlayerWidget:
         # Current bet
         self.bet_label = tk.Label(
             self.frame,
-            text="",
+            textvariable=self.bet_var,
             font=('Arial', self.small_font),
             bg='lightblue'
         )
@@ -140,79 +207,85 @@ class PlayerWidget:
         # Status
         self.status_label = tk.Label(
             self.frame,
-            text="",
+            textvariable=self.status_var,
             font=('Arial', self.small_font),
             bg='lightblue',
             wraplength=self.width - 10,
             justify='center'
         )
         self.status_label.pack()
+        
+        # Recoloured together whenever the player's state changes
+        self._frames = (self.frame, self.cards_frame)
+        self._labels = (
+            self.name_label,
+            self.chips_label,
+            self.last_action_label,
+            self.bet_label,
+            self.status_label,
+            self.hand_label,
+        )
     
-    def update_display(self):
-        """Update the player display"""
-        self.chips_label.config(text=f"${self.player.chips}")
+    def update_display(self, snap, is_current=False):
+        """Update the player display from a PlayerSnap; is_current highlights it"""
+        state = (snap, is_current)
+        if state == self._cached:
+            return
+        self._cached = state
+        
+        _set_text(self._applied, 'chips', self.chips_var, f"${snap.chips}")
         
         # Update cards - always show all cards (no hiding)
         for i, card_widget in enumerate(self.card_widgets):
-            if i < len(self.player.hole_cards):
-                card_widget.update_card(self.player.hole_cards[i])
+            if i < len(snap.hole_cards):
+                card_widget.update_card(snap.hole_cards[i])
             else:
                 card_widget.update_card(None)
 
         # Show evaluated hand (if any)
-        if self.player.best_hand_name:
-            self.hand_label.config(text=self.player.best_hand_name)
-        else:
-            self.hand_label.config(text="")
+        _set_text(self._applied, 'hand', self.hand_var, snap.best_hand_name or "")
 
-        if self.player.last_action_display:
-            self.last_action_label.config(text=self.player.last_action_display)
-        else:
-            self.last_action_label.config(text="")
+        _set_text(self._applied, 'last_action', self.last_action_var, snap.last_action_display or "")
         
         # Update bet display
-        if self.player.current_bet > 0:
-            self.bet_label.config(text=f"Bet: ${self.player.current_bet}")
+        if snap.current_bet > 0:
+            _set_text(self._applied, 'bet', self.bet_var, f"Bet: ${snap.current_bet}")
         else:
-            self.bet_label.config(text="")
-        
-        # Update status
-        status = []
-        if self.player.is_folded:
-            status.append("FOLDED")
-        if self.player.is_all_in:
-            status.append("ALL IN")
-        if self.player.chips <= 0:
-            status.append("OUT OF CHIPS")
-        if self.player.total_bet > 0:
-            status.append(f"Total: ${self.player.total_bet}")
-        if self.player.last_action:
-            status.append(f"Last: {self.player.last_action.upper()}")
-        
-        self.status_label.config(text=" | ".join(status))
+            _set_text(self._applied, 'bet', self.bet_var, "")
+        
+        # Update status; the line only needs rebuilding when one of its inputs moved
+        flags = snap.is_folded | (snap.is_all_in << 1) | ((snap.chips <= 0) << 2)
+        status_key = (flags, snap.total_bet, snap.last_action)
+        if status_key != self._status_key:
+            self._status_key = status_key
+            status = STATUS_FLAG_TEXT[flags]
+            if snap.total_bet > 0:
+                total = f"Total: ${snap.total_bet}"
+                status = f"{status} | {total}" if status else total
+            if snap.last_action:
+                last = f"Last: {snap.last_action.upper()}"
+                status = f"{status} | {last}" if status else last
+            _set_text(self._applied, 'status', self.status_var, status)
         
         # Set colors based on player status
-        if getattr(self.player, "is_eliminated", False):
+        if snap.is_eliminated:
             # Grey out players who are eliminated from the game
-            bg_color = 'lightgray'
-            text_color = 'gray'
-        elif hasattr(self.parent, 'current_player') and self.player == self.parent.current_player:
+            color_state = 'eliminated'
+        elif is_current:
             # Highlight current player
-            bg_color = 'yellow'
-            text_color = 'black'
+            color_state = 'current'
         else:
-            # Normal player
-            bg_color = 'lightblue'
-            text_color = 'black'
-        
-        self.frame.config(bg=bg_color)
-        self.name_label.config(bg=bg_color, fg=text_color)
-        self.chips_label.config(bg=bg_color, fg=text_color)
-        self.cards_frame.config(bg=bg_color)
-        self.last_action_label.config(bg=bg_color, fg=text_color)
-        self.bet_label.config(bg=bg_color, fg=text_color)
-        self.status_label.config(bg=bg_color, fg=text_color)
-        self.hand_label.config(bg=bg_color, fg=text_color)
+            color_state = 'normal'
+        
+        # Recolouring touches every sub-widget, so only do it on a state change
+        if color_state == self._color_state:
+            return
+        self._color_state = color_state
+        bg_color, text_color = PLAYER_PALETTES[color_state]
+        for frame in self._frames:
+            frame.config(bg=bg_color)
+        for label in self._labels:
+            label.config(bg=bg_color, fg=text_color)
     
     def place(self, x, y):
         """Place the widget at specific coordinates"""
@@ -238,8 +311,32 @@ class PokerGUI:
         
         self.player_widgets = []
         self.community_cards = []
+        # Repaints requested between event-loop iterations collapse into one
+        self._dirty = False
+        self._redraw_scheduled = False
+        # Auto-play repaints are capped at this rate; skipped frames fold into a trailing paint
+        self.max_redraw_hz = 30
+        self._last_paint_ms = 0
+        # The game log keeps only the newest lines so long sessions stay responsive
+        self.max_log_lines = 500
+        self._log_lines = 0
+        # Auto-play runs the engine on a worker thread. The lock guards game
+        # state; GUI calls made from the worker are queued for the Tk thread.
+        self._ui_thread = threading.current_thread()
+        self._engine_lock = threading.Lock()
+        self._q = queue.Queue()
+        self._engine_thread = None
+        self._stop_engine = None
+        # Paints read the newest snapshot taken under the lock, never live state.
+        # Snapshots are numbered so one queued before a later change is ignored.
+        self._snap_seq = 0
+        self._latest_snap = None
         self.setup_ui()
+        with self._engine_lock:
+            self._set_snapshot(self._take_snapshot())
         self.update_display()
+        self.root.bind('<Map>', self._on_map)
+        self.root.after(33, self._drain_queue)
     
     def setup_ui(self):
         """Setup the user interface"""
@@ -255,26 +352,32 @@ class PokerGUI:
         self.info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10)
         
         # Pot display
-        self.pot_label = tk.Label(self.info_frame, text="Pot: $0", 
+        self.pot_var = tk.StringVar(self.root, value="Pot: $0")
+        self.hand_count_var = tk.StringVar(self.root, value="Hand: 0")
+        self.phase_var = tk.StringVar(self.root, value="Phase: Preflop")
+        self.current_player_var = tk.StringVar(self.root, value="Current Player: None")
+        self._applied = {}
+        
+        self.pot_label = tk.Label(self.info_frame, textvariable=self.pot_var, 
                                  font=('Arial', 14, 'bold'), bg='lightgray')
         self.pot_label.pack(pady=5)
 
         # Hand counter
         self.hand_count_label = tk.Label(
             self.info_frame,
-            text="Hand: 0",
+            textvariable=self.hand_count_var,
             font=('Arial', 12),
             bg='lightgray'
         )
         self.hand_count_label.pack(pady=5)
         
         # Game phase
-        self.phase_label = tk.Label(self.info_frame, text="Phase: Preflop", 
+        self.phase_label = tk.Label(self.info_frame, textvariable=self.phase_var, 
                                    font=('Arial', 12), bg='lightgray')
         self.phase_label.pack(pady=5)
         
         # Current player
-        self.current_player_label = tk.Label(self.info_frame, text="Current Player: None", 
+        self.current_player_label = tk.Label(self.info_frame, textvariable=self.current_player_var, 
                                            font=('Arial', 12), bg='lightgray')
         self.current_player_label.pack(pady=5)
         
@@ -288,11 +391,19 @@ class PokerGUI:
         
         self.community_cards_frame = tk.Frame(self.community_frame, bg='lightgray')
         self.community_cards_frame.pack()
+        
+        # One widget per board slot (flop, turn, river), shown as cards are dealt
+        self.community_cards = [
+            CardWidget(self.community_cards_frame, None, width=80, height=110)
+            for _ in range(5)
+        ]
+        self.visible_community_cards = 0
 
         # Status / error message label
+        self.message_var = tk.StringVar(self.root)
         self.message_label = tk.Label(
             self.info_frame,
-            text="",
+            textvariable=self.message_var,
             font=('Arial', 9, 'bold'),
             fg='red',
             bg='lightgray',
@@ -367,14 +478,10 @@ class PokerGUI:
         self.player_widgets = []
         players = self.game_manager.game_state.players
         total_players = max(1, len(players))
-        radius_x = 220 + max(0, total_players - 4) * 20
-        radius_y = min(200, 150 + max(0, total_players - 4) * 12)
+        centers = SEAT_CENTERS.get(total_players) or _seat_centers(total_players)
 
         for i, player in enumerate(players):
-            angle = (2 * math.pi * i) / total_players
-            center_x = 400 + radius_x * math.cos(angle)
-            center_y = 250 + radius_y * math.sin(angle)
-
+            center_x, center_y = centers[i]
             player_widget = PlayerWidget(self.canvas, player, i, total_players)
             player_widget.place(
                 int(center_x - (player_widget.width / 2)),
@@ -383,86 +490,168 @@ class PokerGUI:
             self.player_widgets.append(player_widget)
     
     def update_display(self):
-        """Update the entire display"""
+        """Surface any pending engine note and schedule a repaint"""
+        # Take the note now; the engine may replace it before a queued call runs
+        note = self.game_manager.pop_last_action_note()
+        if threading.current_thread() is not self._ui_thread:
+            # Engine calls arrive mid-round with the engine lock held
+            self._q.put((self._apply_engine_update, (note, self._take_snapshot())))
+            return
+        self._show_note(note)
+    
+    def _apply_engine_update(self, note, tagged_snap):
+        self._set_snapshot(tagged_snap)
+        self._show_note(note)
+    
+    def _take_snapshot(self):
+        """Copy the table state for painting; the caller must hold _engine_lock"""
+        self._snap_seq += 1
+        return self._snap_seq, self.game_manager.game_state.snapshot()
+    
+    def _set_snapshot(self, tagged_snap):
+        if self._latest_snap is None or tagged_snap[0] > self._latest_snap[0]:
+            self._latest_snap = tagged_snap
+    
+    def _show_note(self, note):
+        if note:
+            lower_note = note.lower()
+            is_error = "invalid" in lower_note or "error" in lower_note
+            self.show_status_message(note, error=is_error)
+            self.log_message(note, color="error" if is_error else "info")
+        else:
+            self.show_status_message("")
+        self.request_update()
+    
+    def _on_map(self, event):
+        # Toplevel bindings also see every child widget's <Map>; only a restore counts
+        if event.widget is self.root:
+            self.request_update()
+    
+    def request_update(self):
+        """Mark the display dirty and repaint once the event loop goes idle"""
+        self._dirty = True
+        if not self._redraw_scheduled:
+            self._redraw_scheduled = True
+            self.root.after_idle(self._flush)
+    
+    def _flush(self):
+        self._redraw_scheduled = False
+        if not self._dirty:
+            return
+        # Nothing is visible while minimised or withdrawn; <Map> repaints on restore
+        if self.root.state() in ('iconic', 'withdrawn'):
+            return
+        now = int(time.monotonic() * 1000)
+        wait_ms = int(self._last_paint_ms + 1000 / self.max_redraw_hz) - now
+        if self.auto_playing and wait_ms > 0:
+            # The timer only re-queues the flush; the paint itself still waits for idle
+            self._redraw_scheduled = True
+            self.root.after(wait_ms, self.root.after_idle, self._flush)
+            return
+        self._dirty = False
+        self._last_paint_ms = now
+        self._paint(self._latest_snap[1])
+        self.root.update_idletasks()
+    
+    def _paint(self, snap):
+        """Repaint the table from a GameSnapshot"""
         # Update pot
-        self.pot_label.config(text=f"Pot: ${self.game_manager.game_state.pot}")
+        _set_text(self._applied, 'pot', self.pot_var, f"Pot: ${snap.pot}")
 
         # Update hand counter
         limit = self.game_manager.max_hand_limit
-        hand_total = self.game_manager.game_state.hand_count
-        hand_text = f"Hand: {hand_total}"
+        hand_text = f"Hand: {snap.hand_count}"
         if limit:
             hand_text += f" / {limit}"
-        self.hand_count_label.config(text=hand_text)
+        _set_text(self._applied, 'hand_count', self.hand_count_var, hand_text)
         
         # Update phase
-        self.phase_label.config(text=f"Phase: {self.game_manager.game_state.game_phase.title()}")
+        _set_text(self._applied, 'phase', self.phase_var, f"Phase: {snap.game_phase.title()}")
         
         # Update current player
-        if self.game_manager.game_state.current_player < len(self.game_manager.game_state.players):
-            current_player = self.game_manager.game_state.players[self.game_manager.game_state.current_player]
-            self.current_player_label.config(text=f"Current Player: {current_player.name}")
+        if snap.current_player < len(snap.players):
+            current_name = snap.players[snap.current_player].name
+            _set_text(self._applied, 'current_player', self.current_player_var, f"Current Player: {current_name}")
         else:
-            self.current_player_label.config(text="Current Player: None")
+            _set_text(self._applied, 'current_player', self.current_player_var, "Current Player: None")
         
         # Update community cards
-        self.update_community_cards()
+        self.update_community_cards(snap.community_cards)
         
         # Update player widgets
-        for widget in self.player_widgets:
-            widget.update_display()
-
-        note = self.game_manager.pop_last_action_note()
-        if note:
-            lower_note = note.lower()
-            is_error = "invalid" in lower_note or "error" in lower_note
-            self.show_status_message(note, error=is_error)
-            self.log_message(note, color="error" if is_error else "info")
-        else:
-            self.show_status_message("")
+        for i, (widget, player_snap) in enumerate(zip(self.player_widgets, snap.players)):
+            widget.update_display(player_snap, i == snap.current_player)
     
-    def update_community_cards(self):
+    def update_community_cards(self, cards):
         """Update the community cards display"""
-        # Clear existing community cards
-        for widget in self.community_cards:
-            widget.frame.destroy()
-        self.community_cards = []
-        
-        # Create new community card widgets
-        for card in self.game_manager.game_state.community_cards:
-            card_widget = CardWidget(self.community_cards_frame, card, width=80, height=110)
-            card_widget.pack(side=tk.LEFT, padx=2)
-            self.community_cards.append(card_widget)
+        count = min(len(cards), len(self.community_cards))
+        for i in range(count):
+            self.community_cards[i].update_card(cards[i])
+        
+        # Pack newly dealt slots after the visible ones; hide slots cleared by a new hand
+        for i in range(self.visible_community_cards, count):
+            self.community_cards[i].pack(side=tk.LEFT, padx=2)
+        for i in range(count, self.visible_community_cards):
+            self.community_cards[i].pack_forget()
+        self.visible_community_cards = count
+    
+    def _drain_queue(self):
+        """Run GUI calls the engine thread queued since the last poll"""
+        while True:
+            try:
+                func, args = self._q.get_nowait()
+            except queue.Empty:
+                break
+            func(*args)
+        self.root.after(33, self._drain_queue)
     
     def log_message(self, message, color="info"):
         """Add a message to the game log"""
+        if threading.current_thread() is not self._ui_thread:
+            self._q.put((self.log_message, (message, color)))
+            return
         tag = "info" if color == "info" else "error" if color == "error" else "default"
         self.log_text.insert(tk.END, f"{message}\n", tag)
+        self._log_lines += message.count("\n") + 1
+        excess = self._log_lines - self.max_log_lines
+        if excess > 0:
+            self.log_text.delete('1.0', f'{excess + 1}.0')
+            self._log_lines -= excess
         self.log_text.see(tk.END)
 
     def show_status_message(self, message: str, error: bool = False):
         """Display transient feedback for invalid moves or other alerts."""
+        if threading.current_thread() is not self._ui_thread:
+            self._q.put((self.show_status_message, (message, error)))
+            return
         if message:
-            self.message_label.config(text=message, fg='red' if error else 'black')
-        else:
-            self.message_label.config(text="")
+            color = 'red' if error else 'black'
+            if self._applied.get('message_fg') != color:
+                self.message_label.config(fg=color)
+                self._applied['message_fg'] = color
+        _set_text(self._applied, 'message', self.message_var, message)
     
     def new_hand(self):
         """Start a new hand"""
-        self.game_manager.start_new_hand()
+        with self._engine_lock:
+            self.game_manager.start_new_hand()
+            self._set_snapshot(self._take_snapshot())
         self.log_message("=== NEW HAND DEALT ===")
         self.update_display()
     
     def next_phase(self):
         """Move to the next game phase"""
-        self.game_manager.next_phase()
-        self.log_message(f"Phase changed to: {self.game_manager.game_state.game_phase}")
+        with self._engine_lock:
+            self.game_manager.next_phase()
+            self._set_snapshot(self._take_snapshot())
+        self.log_message(f"Phase changed to: {self._latest_snap[1].game_phase}")
         self.update_display()
     
     def toggle_auto_play(self):
         """Toggle autonomous play on/off"""
         if self.auto_playing:
             self.auto_playing = False
+            self._stop_engine.set()
             self.auto_button.config(text="Start Auto Play", bg='green')
             self.log_message("Autonomous play stopped")
         else:
@@ -471,8 +660,13 @@ class PokerGUI:
             self.log_message("Autonomous play started")
             
             # Start a new hand if no hand is in progress
-            if self.game_manager.game_state.game_phase == "showdown" or len(self.game_manager.game_state.players[0].hole_cards) == 0:
-                self.game_manager.start_new_hand()
+            with self._engine_lock:
+                state = self.game_manager.game_state
+                dealt = state.game_phase == "showdown" or len(state.players[0].hole_cards) == 0
+                if dealt:
+                    self.game_manager.start_new_hand()
+                    self._set_snapshot(self._take_snapshot())
+            if dealt:
                 self.log_message("=== NEW HAND DEALT ===")
                 self.update_display()
             
@@ -491,29 +685,43 @@ class PokerGUI:
             self.log_message("Invalid interval format")
     
     def schedule_next_move(self):
-        """Schedule the next autonomous move"""
-        if self.auto_playing:
-            self.root.after(int(self.game_manager.move_interval * 1000), self.play_autonomous_move)
-    
-    def play_autonomous_move(self):
-        """Play one autonomous move"""
+        """Start the engine thread that plays autonomous rounds"""
         if not self.auto_playing:
             return
-        
-        # Play one round
-        continue_playing = self.game_manager.play_autonomous_round()
-        
+        # Each run gets its own stop event so a thread finishing its last
+        # round after a stop/start cannot keep playing
+        self._stop_engine = threading.Event()
+        self._engine_thread = threading.Thread(
+            target=self._engine_loop, args=(self._stop_engine,), daemon=True
+        )
+        self._engine_thread.start()
+    
+    def _engine_loop(self, stop):
+        """Play rounds every move_interval seconds until stopped (engine thread)"""
+        while not stop.is_set():
+            with self._engine_lock:
+                if stop.is_set():
+                    break
+                continue_playing = self.game_manager.play_autonomous_round()
+                note = self.game_manager.pop_last_action_note()
+                tagged_snap = self._take_snapshot()
+            self._q.put((self.play_autonomous_move, (continue_playing, tagged_snap, note)))
+            if not continue_playing:
+                break
+            stop.wait(self.game_manager.move_interval)
+    
+    def play_autonomous_move(self, continue_playing, tagged_snap, note):
+        """Handle the result of one autonomous round on the Tk thread"""
         # Update display
-        self.update_display()
+        self._apply_engine_update(note, tagged_snap)
+        if not self.auto_playing:
+            return
         
-        # Schedule next move if still playing
-        if continue_playing and self.auto_playing:
-            self.schedule_next_move()
-        else:
+        if not continue_playing:
             # End of hand or game
             self.auto_playing = False
             self.auto_button.config(text="Start Auto Play", bg='green')
-            if self.game_manager.game_state.game_phase == "showdown":
+            if tagged_snap[1].game_phase == "showdown":
                 self.log_message("Hand completed - check winners!")
     
     def run(self):
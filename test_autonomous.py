@@ -3,70 +3,108 @@
 Test autonomous poker gameplay
 """
 
+import argparse
+import time
+
 from game_manager import GameManager
 
-def test_autonomous_gameplay():
-    """Test full autonomous gameplay"""
-    print("Testing Autonomous Poker Gameplay")
-    print("=" * 40)
-    
-    # Create game manager with 0.5 second intervals for faster testing
-    game = GameManager(move_interval=0.5)
+def show_round_state(game):
+    """Print the table after an autonomous round"""
+    print(f"Phase: {game.game_state.game_phase}")
+    print(f"Pot: ${game.game_state.pot}")
+    print(f"Current player: {game.game_state.players[game.game_state.current_player].name}")
     
-    print(f"Loaded {len(game.game_state.players)} players:")
+    # Show player actions
     for player in game.game_state.players:
-        print(f"  - {player.name}: ${player.chips} chips")
-    
-    print("\nStarting new hand...")
-    game.start_new_hand()
-    
-    print(f"Game phase: {game.game_state.game_phase}")
-    print("Community cards:", [str(card) for card in game.game_state.community_cards])
-    
-    for player in game.game_state.players:
-        print(f"{player.name}: {[str(card) for card in player.hole_cards]} (${player.chips} chips)")
-    
-    print("\nPlaying autonomous rounds...")
-    round_count = 0
-    max_rounds = 20  # Prevent infinite loops
+        status = []
+        if player.is_folded:
+            status.append("FOLDED")
+        if player.is_all_in:
+            status.append("ALL IN")
+        if player.current_bet > 0:
+            status.append(f"BET: ${player.current_bet}")
+        if player.last_action:
+            status.append(f"Last: {player.last_action}")
+        
+        status_str = f" ({', '.join(status)})" if status else ""
+        print(f"  {player.name}: ${player.chips} chips{status_str}")
+
+def play_rounds(game, max_rounds, verbose=False, sleep=0.0):
+    """Play autonomous rounds until the hand loop stops; returns the rounds played"""
+    round_count = 0  # max_rounds prevents infinite loops
     
     while round_count < max_rounds:
         round_count += 1
-        print(f"\n--- Round {round_count} ---")
+        if verbose:
+            print(f"\n--- Round {round_count} ---")
         
         # Play one autonomous round
         continue_playing = game.play_autonomous_round()
         
-        # Show current state
-        print(f"Phase: {game.game_state.game_phase}")
-        print(f"Pot: ${game.game_state.pot}")
-        print(f"Current player: {game.game_state.players[game.game_state.current_player].name}")
-        
-        # Show player actions
-        for player in game.game_state.players:
-            status = []
-            if player.is_folded:
-                status.append("FOLDED")
-            if player.is_all_in:
-                status.append("ALL IN")
-            if player.current_bet > 0:
-                status.append(f"BET: ${player.current_bet}")
-            if player.last_action:
-                status.append(f"Last: {player.last_action}")
-            
-            status_str = f" ({', '.join(status)})" if status else ""
-            print(f"  {player.name}: ${player.chips} chips{status_str}")
+        if verbose:
+            show_round_state(game)
         
         if not continue_playing:
-            print("Hand completed!")
+            if verbose:
+                print("Hand completed!")
             break
         
-        # Small delay to see the progression
-        import time
-        time.sleep(0.1)
+        # Optional delay to see the progression
+        if sleep:
+            time.sleep(sleep)
+    
+    return round_count
+
+def test_autonomous_gameplay(verbose=False, sleep=0.0, max_rounds=20):
+    """Test full autonomous gameplay"""
+    # Timing runs stay silent so console output doesn't swamp the engine work
+    if verbose:
+        print("Testing Autonomous Poker Gameplay")
+        print("=" * 40)
+    
+    # Create game manager with 0.5 second intervals for faster testing
+    game = GameManager(move_interval=0.5)
+    
+    if verbose:
+        print(f"Loaded {len(game.game_state.players)} players:")
+        for player in game.game_state.players:
+            print(f"  - {player.name}: ${player.chips} chips")
+        print("\nStarting new hand...")
+    
+    game.start_new_hand()
+    
+    if verbose:
+        print(f"Game phase: {game.game_state.game_phase}")
+        print("Community cards:", [str(card) for card in game.game_state.community_cards])
+        for player in game.game_state.players:
+            print(f"{player.name}: {[str(card) for card in player.hole_cards]} (${player.chips} chips)")
+        print("\nPlaying autonomous rounds...")
+    
+    round_count = play_rounds(game, max_rounds, verbose=verbose, sleep=sleep)
+    
+    if verbose:
+        print(f"\nCompleted {round_count} rounds")
+        print("Autonomous gameplay test completed successfully!")
+
+def time_autonomous_gameplay(games=50, max_rounds=100):
+    """Report engine throughput over silent autonomous games"""
+    # Agent loading and dealing happen up front; only the round loop is timed
+    managers = [GameManager(move_interval=0.5) for _ in range(games)]
+    for game in managers:
+        game.start_new_hand()
     
-    print(f"\nCompleted {round_count} rounds")
-    print("Autonomous gameplay test completed successfully!")
+    start = time.perf_counter()
+    rounds = sum(play_rounds(game, max_rounds) for game in managers)
+    elapsed = time.perf_counter() - start
+    print(f"{rounds} rounds in {elapsed:.2f}s ({rounds / elapsed:.0f} rounds/sec)")
 
 if __name__ == "__main__":
-    test_autonomous_gameplay()
+    parser = argparse.ArgumentParser(description="Autonomous gameplay test")
+    parser.add_argument("--time", action="store_true",
+                        help="Time silent games instead of printing each round")
+    parser.add_argument("--games", type=int, default=50, help="Games to play with --time")
+    args = parser.parse_args()
+    if args.time:
+        time_autonomous_gameplay(games=args.games)
+    else:
+        test_autonomous_gameplay(verbose=True, sleep=0.1)
@@ -71,5 +71,45 @@ def test_game_logic():
     print("The poker game system is working correctly.")
     print("Note: GUI requires tkinter which may not be available in all environments.")
 
+def test_hand_evaluation():
+    """Check the 7-card evaluator against hands with known labels"""
+    print("\nTesting Hand Evaluation")
+    print("=======================")
+    
+    game = GameManager()
+    suits = {"h": Suit.HEARTS, "d": Suit.DIAMONDS, "c": Suit.CLUBS, "s": Suit.SPADES}
+    
+    def parse(hand):
+        return [Card(token[:-1], suits[token[-1]]) for token in hand.split()]
+    
+    cases = [
+        ("10h Jh Qh Kh Ah 2c 3d", "Royal Flush"),
+        ("Ah 2h 3h 4h 5h 9c 9d", "Straight Flush (Five high)"),
+        ("9s 9h 9d 9c Kh 2c 3d", "Four of Nines"),
+        ("Ks Kh Kd 5c 5h 5d 2c", "Full House (Kings over Fives)"),
+        ("2h 7h 9h Jh Kh Kc Kd", "Flush (King high)"),
+        ("Ac 2d 3h 4s 5c Kd Kh", "Straight to Five"),
+        ("6c 7d 8h 9s 10c Jd Jh", "Straight to Jack"),
+        ("Qs Qh Qd 2c 7h 9d Kc", "Three of Queens"),
+        ("Js Jh 4d 4c 3h 3d Ac", "Two Pair (Jacks and Fours)"),
+        ("8s 8h 2d 5c 7h 10d Kc", "Pair of Eights"),
+        ("2s 4h 6d 8c 10h Qd Ac", "High Card Ace"),
+    ]
+    
+    for hand, expected in cases:
+        hand_rank, kickers = game.evaluate_hand(parse(hand))
+        name = game._hand_rank_to_name(hand_rank, kickers)
+        print(f"  {hand}: {name}")
+        assert name == expected, f"{hand} evaluated as {name}, expected {expected}"
+    
+    # Kickers decide between otherwise equal hands
+    board = "Kd 9c 7s 4h 2d"
+    ace_kicker = game.evaluate_hand(parse(f"Kh Ac {board}"))
+    queen_kicker = game.evaluate_hand(parse(f"Ks Qc {board}"))
+    assert ace_kicker > queen_kicker, "Ace kicker should beat Queen kicker"
+    
+    print("\nHand evaluation test completed successfully!")
+
 if __name__ == "__main__":
     test_game_logic()
+    test_hand_evaluation()